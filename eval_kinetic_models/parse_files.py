@@ -3,19 +3,12 @@
 .. moduleauthor:: Kyle Niemeyer <kyle.niemeyer@gmail.com>
 """
 
-# Python 2 compatibility
-from __future__ import print_function
-from __future__ import division
-
 # Standard libraries
 import sys
 from os.path import splitext, basename
 import numpy as np
 
-try:
-    import xml.etree.cElementTree as ET
-except ImportError:
-    import xml.etree.ElementTree as ET
+from xml.etree import ElementTree as ET
 
 # Local imports
 from .exceptions import (KeywordError, UndefinedElementError,
@@ -218,10 +211,53 @@ def get_datapoints(properties, root):
     return properties
 
 
-def read_experiment(filename):
+def get_datapoints_iterparse(properties, filename):
+    """Parse datapoints with ignition delay from file, via streaming.
+
+    Equivalent to :func:`get_datapoints`, but streams the file with
+    ``ET.iterparse`` rather than holding the whole tree in memory; child
+    elements are released as soon as each data point has been read.
+
+    :param dict properties: Dictionary with experimental properties
+    :param str filename: XML filename in ReSpecTh format with experimental data
+    :return: Dictionary with ignition delay data
+    :rtype: dict
+    """
+    property_id = {}
+    units = {}
+    values = {}
+    in_group = False
+    for event, elem in ET.iterparse(filename, events=('start', 'end')):
+        if elem.tag == 'dataGroup':
+            if event == 'start':
+                in_group = True
+            else:
+                in_group = False
+                elem.clear()
+        elif not in_group or event != 'end':
+            continue
+        elif elem.tag == 'property':
+            # get properties of dataGroup
+            property_id[elem.attrib['id']] = elem.attrib['name']
+            units[elem.attrib['name']] = elem.attrib['units']
+            values[elem.attrib['name']] = []
+            elem.clear()
+        elif elem.tag == 'dataPoint':
+            for val in elem:
+                values[property_id[val.tag]].append(float(val.text))
+            elem.clear()
+
+    for name, vals in values.items():
+        properties[name] = Property(np.array(vals), units[name])
+
+    return properties
+
+
+def read_experiment(filename, use_iterparse=False):
     """Reads experiment data from ReSpecTh XML file.
 
     :param str filename: XML filename in ReSpecTh format with experimental data
+    :param bool use_iterparse: Parse datapoints via streaming ``iterparse``
     :return: Dictionary with group of experimental properties
     :rtype: dict
     """
@@ -245,7 +281,10 @@ def read_experiment(filename):
     properties = get_ignition_type(properties, root)
 
     # Now parse ignition delay datapoints
-    properties = get_datapoints(properties, root)
+    if use_iterparse:
+        properties = get_datapoints_iterparse(properties, filename)
+    else:
+        properties = get_datapoints(properties, root)
 
     # Get compression time for RCM, if volume history given
     if 'volume' in properties and 'compression time' not in properties:
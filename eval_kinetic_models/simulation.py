@@ -3,10 +3,6 @@
 .. moduleauthor:: Kyle Niemeyer <kyle.niemeyer@gmail.com>
 """
 
-# Python 2 compatibility
-from __future__ import print_function
-from __future__ import division
-
 # Standard libraries
 import os
 from collections import namedtuple
@@ -0,0 +1,60 @@
+import functools
+import os
+
+import pkg_resources
+import pytest
+
+from .. import parse_files
+
+# The C accelerator is the default in xml.etree.ElementTree since Python 3.3;
+# optionally use lxml's faster parser if requested via environment variable.
+if os.environ.get('USE_LXML'):
+    from lxml import etree as ET
+else:
+    from xml.etree import ElementTree as ET
+
+# Test XML files in ReSpecTh format, keyed by short name
+test_files = {'st': 'testfile_st.xml',
+              'st2': 'testfile_st2.xml',
+              'rcm': 'testfile_rcm.xml'
+              }
+
+
+@functools.lru_cache(maxsize=None)
+def _path(name):
+    """Resolve a test data file to an absolute path, caching the result.
+
+    ``pkg_resources.resource_filename`` is surprisingly expensive, so only
+    pay for it once per unique filename.
+
+    :param str name: Name of test data file
+    :return: Absolute path to test data file
+    :rtype: str
+    """
+    return pkg_resources.resource_filename(__name__, name)
+
+
+@pytest.fixture(scope='session')
+def xml_roots():
+    """Parse each test XML file once for the whole test session.
+
+    :return: Dictionary mapping short names to ``(root, filename)`` tuples
+    :rtype: dict
+    """
+    roots = {}
+    for name, file_path in test_files.items():
+        filename = _path(file_path)
+        roots[name] = (ET.parse(filename).getroot(), filename)
+    return roots
+
+
+@pytest.fixture(scope='session')
+def parsed_experiments():
+    """Read each test experiment file once for the whole test session.
+
+    :return: Dictionary mapping short names to experiment properties
+    :rtype: dict
+    """
+    return {name: parse_files.read_experiment(_path(file_path))
+            for name, file_path in test_files.items()
+            }
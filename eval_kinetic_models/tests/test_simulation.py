@@ -1,7 +1,3 @@
-# Python 2 compatibility
-from __future__ import print_function
-from __future__ import division
-
 import os
 import pkg_resources
 import numpy as np
@@ -1,7 +1,3 @@
-# Python 2 compatibility
-from __future__ import print_function
-from __future__ import division
-
 # Standard libraries
 import os
 from os.path import splitext, basename